@@ -11,40 +11,241 @@ Hush 框架客户端 Python 示例
 
 依赖:
     pip install requests
+    pip install httpx[http2]   # 可选，用于异步客户端
+    pip install orjson         # 可选，更快的 JSON 编解码
+    pip install numba          # 可选，JIT 编译数值计算
+    pip install ijson          # 可选，流式解析大型 JSON 响应
 
 使用方法:
     python client_examples.py
 """
 
+import copy
+import functools
 import json
 import time
+import weakref
+import atexit
+import asyncio
+import concurrent.futures
 import logging
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import importlib.util
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Mapping, Callable
+from dataclasses import dataclass, replace
 from contextlib import contextmanager
 
 try:
     import requests
+    import urllib3
     from requests.adapters import HTTPAdapter
-    from requests.packages.urllib3.util.retry import Retry
+    from urllib3.util.retry import Retry
 except ImportError:
     print("❌ 请安装 requests 库: pip install requests")
     exit(1)
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# httpx 的 HTTP/2 支持依赖 h2 包
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+class _CachedTimeFormatter(logging.Formatter):
+    """按秒缓存 asctime 的日志格式化器，同一秒内的记录不再重复调用 strftime"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._cached = ''
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._cached = time.strftime('%Y-%m-%d %H:%M:%S', self.converter(sec))
+            self._last_sec = sec
+        # 与默认 asctime 格式保持一致
+        return f'{self._cached},{int(record.msecs):03d}'
+
+
 # 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(_CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _create_session() -> requests.Session:
+    """创建配置了重试策略和连接池的会话"""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=10,
+        pool_maxsize=50,
+        pool_block=False
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# 进程级共享会话，所有客户端默认复用同一个连接池
+_DEFAULT_SESSION = _create_session()
+
+# 每个客户端缓存的端点 URL 数量上限
+_URL_CACHE_SIZE = 64
+
+# 进程级共享线程池，线程按需创建并在多次调用间复用
+_SHARED_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8,
+    thread_name_prefix='hush-'
+)
+atexit.register(_SHARED_EXECUTOR.shutdown)
+
+
+def _backoff_kernel(delay: float, schedule) -> None:
+    """填充指数退避的等待时间表（numba 可用时会被 JIT 编译）"""
+    for attempt in range(schedule.shape[0]):
+        schedule[attempt] = delay * (2.0 ** attempt)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_backoff_impl() -> Optional[Tuple[Any, Callable]]:
+    """首次使用时才导入 numpy/numba，避免拖慢模块导入；不可用时返回 None"""
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+    # cache=True 把编译结果写入磁盘，后续进程无需重复编译
+    return np, njit(cache=True)(_backoff_kernel)
+
+
+def _backoff_schedule(delay: float, max_retries: int):
+    """计算指数退避的等待时间表，numba 可用时走 JIT 编译实现，否则使用纯 Python"""
+    impl = _load_backoff_impl()
+    if impl is None:
+        return [delay * (2.0 ** attempt) for attempt in range(max_retries)]
+    np, kernel = impl
+    schedule = np.empty(max_retries, dtype=np.float64)
+    kernel(delay, schedule)
+    return schedule
+
+
+def _is_declared_non_json(headers: Mapping[str, str]) -> bool:
+    """
+    响应是否显式声明了非 JSON 的 Content-Type
+    
+    Hush 路由处理器返回的 JSON 不带 Content-Type，因此缺少该头时不能视为非 JSON。
+    """
+    content_type = headers.get('content-type')
+    if not content_type:
+        return False
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return not (media_type == 'application/json' or media_type.endswith('+json'))
+
+
+def _parse_response_data(response) -> Any:
+    """解析响应体，显式声明为非 JSON 的响应直接返回文本，其余尝试 JSON 解码"""
+    if response.content and not _is_declared_non_json(response.headers):
+        try:
+            return _json_loads(response.content)
+        except ValueError:
+            pass
+    return response.text
+
+
+def _iter_json_items(response, prefix: str) -> Iterator[Any]:
+    """
+    逐个产出 JSON 数组中的元素，读取完毕后释放连接
+    
+    Args:
+        response: 以 stream=True 发出的 requests 响应
+        prefix: ijson 前缀，例如顶层数组为 'item'，{"users": [...]} 为 'users.item'
+        
+    Raises:
+        HushApiError: 响应体不是预期结构的 JSON，或读取过程中出现网络错误
+    """
+    try:
+        if ijson is not None:
+            response.raw.decode_content = True
+            try:
+                # use_float 使小数与 get_users() 一样解析为 float 而不是 Decimal
+                yield from ijson.items(response.raw, prefix, use_float=True)
+            except ijson.JSONError as e:
+                raise HushApiError(f"无效的 JSON 响应: {e}", response.status_code)
+        else:
+            data = _parse_response_data(response)
+            try:
+                for key in prefix.split('.')[:-1]:
+                    data = data[key]
+            except (KeyError, IndexError, TypeError):
+                raise HushApiError(f"JSON 响应中缺少 '{prefix}'", response.status_code, data)
+            if not isinstance(data, list):
+                raise HushApiError(f"JSON 响应中 '{prefix}' 不是数组", response.status_code, data)
+            yield from data
+    except (urllib3.exceptions.HTTPError, requests.exceptions.RequestException) as e:
+        # 流式读取发生在 _send 之外，需要在这里统一转换网络异常
+        logger.error("❌ 网络错误: %s", e)
+        raise HushApiError(f"网络错误: {str(e)}")
+    finally:
+        response.close()
+
+
+def _stream_json_items(response, prefix: str) -> Iterator[Any]:
+    """
+    返回流式 JSON 数组迭代器
+    
+    响应显式声明为非 JSON 时立即抛出 HushApiError；未声明 Content-Type 时
+    交由 JSON 解析判断。迭代器即使从未被迭代，在被回收时也会关闭响应，
+    把连接归还连接池。
+    
+    Raises:
+        HushApiError: 响应的 Content-Type 不是 JSON
+    """
+    if _is_declared_non_json(response.headers):
+        response.close()
+        raise HushApiError(
+            f"响应不是 JSON: {response.headers['content-type']}",
+            response.status_code
+        )
+    
+    items = _iter_json_items(response, prefix)
+    # 未启动的生成器被关闭或回收时不会执行 finally，需单独登记
+    weakref.finalize(items, response.close)
+    return items
+
+
+@dataclass(slots=True, frozen=True)
 class ApiResponse:
-    """API 响应数据类"""
+    """API 响应数据类（不可变，使用 __slots__ 以减少内存占用）"""
     status_code: int
     data: Any
-    headers: Dict[str, str]
+    headers: Mapping[str, str]
     elapsed_ms: float
 
 
@@ -56,42 +257,127 @@ class HushApiError(Exception):
         self.response_data = response_data
 
 
+def _check_response(response, data: Any, ok: bool, reason: str) -> ApiResponse:
+    """
+    构建 ApiResponse 并检查响应状态，同步和异步客户端共用
+    
+    Args:
+        response: requests 或 httpx 的响应对象
+        data: 已解析的响应数据
+        ok: 状态码是否表示成功
+        reason: 状态码对应的原因短语
+        
+    Raises:
+        HushApiError: 响应状态码表示失败
+    """
+    api_response = ApiResponse(
+        status_code=response.status_code,
+        data=data,
+        headers=response.headers,
+        elapsed_ms=response.elapsed.total_seconds() * 1000
+    )
+    
+    # 检查响应状态
+    if ok:
+        logger.info("✅ 请求成功: %s (%.2fms)", response.status_code, api_response.elapsed_ms)
+        return api_response
+    else:
+        error_msg = f"HTTP {response.status_code}: {reason}"
+        logger.error("❌ 请求失败: %s", error_msg)
+        raise HushApiError(error_msg, response.status_code, data)
+
+
 class HushApiClient:
     """
     Hush API 客户端类
     提供与 Hush 框架后端 API 交互的方法
     """
     
-    def __init__(self, base_url: str = "http://localhost:8080", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        timeout: int = 30,
+        session: Optional[requests.Session] = None,
+        cache_ttl: float = 5.0,
+        warmup: bool = False
+    ):
         """
         初始化 API 客户端
         
         Args:
             base_url: API 基础 URL
             timeout: 请求超时时间（秒）
+            session: 自定义会话，默认复用进程级共享会话
+            cache_ttl: 幂等 GET 响应的缓存时间（秒），0 表示禁用缓存
+            warmup: 是否在构造时预热连接，使首个真实请求只需 1 个 RTT
+                    而不是 DNS + TCP (+ TLS) 握手的 3-4 个 RTT；
+                    主机不可达时构造最多额外阻塞 2 秒
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.token = None
+        self.session = session if session is not None else _DEFAULT_SESSION
+        self.cache_ttl = cache_ttl
+        self._response_cache: Dict[tuple, Tuple[float, ApiResponse]] = {}
+        self._url_cache: Dict[str, str] = {}
+        self._preflight_cache: Dict[tuple, Tuple[float, ApiResponse]] = {}
+        self._base_headers = self._build_base_headers()
         
-        # 创建会话并配置重试策略
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        if warmup:
+            self.warmup()
+    
+    def warmup(self) -> None:
+        """
+        发送 HEAD /health 预热 DNS 缓存和连接池，失败时静默忽略
+        
+        探测请求直接走会话适配器为该 URL 选用的 urllib3 连接池（连接会留在
+        该池中供后续请求复用），但不使用适配器的重试策略，因此主机不可达时
+        最多阻塞 2 秒。
+        """
+        try:
+            request = self.session.prepare_request(
+                requests.Request('HEAD', self._build_url('/health'))
+            )
+            adapter = self.session.get_adapter(request.url)
+            # 与 session.request 一样合并环境变量中的代理和证书配置
+            settings = self.session.merge_environment_settings(request.url, {}, None, None, None)
+            proxies = settings['proxies']
+            
+            # requests 会按 TLS 配置区分连接池，必须取与真实请求相同的池
+            if hasattr(adapter, 'get_connection_with_tls_context'):
+                pool = adapter.get_connection_with_tls_context(
+                    request, settings['verify'], proxies, settings['cert']
+                )
+            else:
+                pool = adapter.get_connection(request.url, proxies)
+            pool.urlopen(
+                'HEAD',
+                adapter.request_url(request, proxies),
+                headers=request.headers,
+                retries=False,
+                timeout=urllib3.Timeout(total=2)
+            )
+        except Exception:
+            # 预热只是优化，URL 无效、网络不可达等任何失败都不应影响客户端构造
+            pass
     
     def set_auth_token(self, token: str) -> None:
         """设置认证令牌"""
-        self.token = token
+        if token != self.token:
+            self.token = token
+            self._base_headers = self._build_base_headers()
+            self._response_cache.clear()
         logger.info("🔐 已设置认证令牌")
     
-    def _get_headers(self, additional_headers: Dict[str, str] = None) -> Dict[str, str]:
-        """获取请求头"""
+    def clear_auth_token(self) -> None:
+        """清除认证令牌"""
+        if self.token is not None:
+            self.token = None
+            self._base_headers = self._build_base_headers()
+            self._response_cache.clear()
+    
+    def _build_base_headers(self) -> Dict[str, str]:
+        """构建基础请求头，仅在令牌变化时调用"""
         headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'HushApiClient/1.0.0 (Python)'
@@ -100,20 +386,40 @@ class HushApiClient:
         if self.token:
             headers['Authorization'] = f'Bearer {self.token}'
         
-        if additional_headers:
-            headers.update(additional_headers)
-        
         return headers
     
+    def _get_headers(self, additional_headers: Dict[str, str] = None) -> Dict[str, str]:
+        """获取请求头（返回的基础请求头是共享的，调用方不得修改）"""
+        if not additional_headers:
+            return self._base_headers
+        return {**self._base_headers, **additional_headers}
+    
+    def _build_url(self, endpoint: str) -> str:
+        """拼接完整 URL，常用端点的结果会被缓存"""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = f"{self.base_url}{endpoint}"
+            if len(self._url_cache) < _URL_CACHE_SIZE:
+                self._url_cache[endpoint] = url
+        return url
+    
     @contextmanager
     def _performance_monitor(self, operation: str):
-        """性能监控上下文管理器"""
-        start_time = time.time()
+        """
+        性能监控上下文管理器，INFO 日志关闭时不计时
+        
+        用于包裹外层操作；单个请求的耗时已由 ApiResponse.elapsed_ms 提供
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            yield
+            return
+        
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            elapsed = (time.time() - start_time) * 1000
-            logger.info(f"⏱️ {operation} 耗时: {elapsed:.2f}ms")
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            logger.info("⏱️ %s 耗时: %.2fms", operation, elapsed_ms)
     
     def _make_request(
         self, 
@@ -121,7 +427,9 @@ class HushApiClient:
         endpoint: str, 
         data: Any = None, 
         headers: Dict[str, str] = None,
-        params: Dict[str, str] = None
+        params: Dict[str, str] = None,
+        stream: bool = False,
+        item_prefix: str = 'item'
     ) -> ApiResponse:
         """
         发送 HTTP 请求
@@ -132,6 +440,8 @@ class HushApiClient:
             data: 请求数据
             headers: 额外的请求头
             params: URL 参数
+            stream: 是否流式读取响应，为 True 时 data 是逐个产出数组元素的生成器
+            item_prefix: 流式读取时数组元素的 ijson 前缀
             
         Returns:
             ApiResponse: 响应对象
@@ -139,96 +449,363 @@ class HushApiClient:
         Raises:
             HushApiError: API 请求异常
         """
-        url = f"{self.base_url}{endpoint}"
-        request_headers = self._get_headers(headers)
+        return self._send(
+            method,
+            endpoint,
+            functools.partial(self.session.request, method),
+            data=_json_dumps(data) if data and method in {'POST', 'PUT', 'PATCH'} else None,
+            headers=self._get_headers(headers),
+            params=params,
+            stream=stream,
+            item_prefix=item_prefix
+        )
+    
+    def _get(
+        self,
+        endpoint: str,
+        params: Dict[str, str] = None,
+        headers: Dict[str, str] = None
+    ) -> ApiResponse:
+        """GET 请求的特化版本，省去 _make_request 的方法判断和请求体处理"""
+        return self._send(
+            'GET',
+            endpoint,
+            self.session.get,
+            headers=self._get_headers(headers),
+            params=params
+        )
+    
+    def _post(
+        self,
+        endpoint: str,
+        data: Any,
+        headers: Dict[str, str] = None
+    ) -> ApiResponse:
+        """POST 请求的特化版本，请求体总是以 JSON 发送"""
+        return self._send(
+            'POST',
+            endpoint,
+            self.session.post,
+            data=_json_dumps(data),
+            headers=self._get_headers(headers)
+        )
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[..., requests.Response],
+        stream: bool = False,
+        item_prefix: str = 'item',
+        **kwargs
+    ) -> ApiResponse:
+        """
+        发送请求并处理响应，网络异常统一转换为 HushApiError
         
-        logger.info(f"🚀 发送请求: {method} {url}")
+        Args:
+            method: HTTP 方法（仅用于日志）
+            endpoint: API 端点
+            send: 实际发送请求的会话方法，以 URL 为第一个参数
+            stream: 是否流式读取响应
+            item_prefix: 流式读取时数组元素的 ijson 前缀
+            **kwargs: 透传给 send 的请求参数
+        """
+        url = self._build_url(endpoint)
+        
+        logger.info("🚀 发送请求: %s %s", method, url)
         
         try:
-            with self._performance_monitor(f"{method} {endpoint}"):
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=data if data and method in ['POST', 'PUT', 'PATCH'] else None,
-                    headers=request_headers,
-                    params=params,
-                    timeout=self.timeout
-                )
-            
-            # 解析响应数据
-            try:
-                response_data = response.json()
-            except json.JSONDecodeError:
-                response_data = response.text
-            
-            api_response = ApiResponse(
-                status_code=response.status_code,
-                data=response_data,
-                headers=dict(response.headers),
-                elapsed_ms=response.elapsed.total_seconds() * 1000
-            )
-            
-            # 检查响应状态
-            if response.ok:
-                logger.info(f"✅ 请求成功: {response.status_code}")
-                return api_response
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.reason}"
-                logger.error(f"❌ 请求失败: {error_msg}")
-                raise HushApiError(error_msg, response.status_code, response_data)
+            response = send(url, timeout=self.timeout, stream=stream, **kwargs)
+            return self._process_response(response, stream, item_prefix)
                 
         except requests.exceptions.RequestException as e:
-            logger.error(f"❌ 网络错误: {str(e)}")
+            logger.error("❌ 网络错误: %s", e)
             raise HushApiError(f"网络错误: {str(e)}")
     
+    def _process_response(
+        self,
+        response: requests.Response,
+        stream: bool = False,
+        item_prefix: str = 'item'
+    ) -> ApiResponse:
+        """
+        解析响应并检查状态
+        
+        Raises:
+            HushApiError: 响应状态码表示失败
+        """
+        # urllib3 以整数表示协议版本（11 即 HTTP/1.1）
+        logger.debug("🔗 协议版本: %s", response.raw.version)
+        
+        # 解析响应数据，流式成功响应延迟到迭代时再读取
+        if stream and response.ok:
+            response_data = _stream_json_items(response, item_prefix)
+        else:
+            response_data = _parse_response_data(response)
+        
+        return _check_response(response, response_data, response.ok, response.reason)
+    
+    def _cached_get(self, endpoint: str, params: Dict[str, str] = None) -> ApiResponse:
+        """
+        带 TTL 缓存的 GET 请求，仅用于幂等端点
+        
+        缓存键为 (method, endpoint, params)，认证令牌变化时缓存整体失效。
+        失败的请求会抛出异常，因此不会被缓存。
+        每次返回的 data 都是缓存内容的深拷贝，调用方修改结果不会污染缓存。
+        """
+        if self.cache_ttl <= 0:
+            return self._get(endpoint, params=params)
+        
+        key = ('GET', endpoint, frozenset(params.items()) if params else None)
+        cached = self._response_cache.get(key)
+        now = time.monotonic()
+        if cached is None or now - cached[0] >= self.cache_ttl:
+            cached = (now, self._get(endpoint, params=params))
+            self._response_cache[key] = cached
+        
+        response = cached[1]
+        return replace(response, data=copy.deepcopy(response.data))
+    
     # ========================================================================
     # API 方法
     # ========================================================================
     
     def health_check(self) -> Dict[str, Any]:
-        """健康检查"""
-        response = self._make_request('GET', '/health')
+        """健康检查（结果缓存 cache_ttl 秒）"""
+        response = self._cached_get('/health')
         return response.data
     
     def get_user_info(self) -> str:
-        """获取用户信息"""
-        response = self._make_request('GET', '/user')
+        """获取用户信息（结果缓存 cache_ttl 秒）"""
+        response = self._cached_get('/user')
         return response.data
     
     def get_users(self) -> Dict[str, Any]:
         """获取用户列表（需要认证）"""
-        response = self._make_request('GET', '/api/users')
+        response = self._get('/api/users')
+        return response.data
+    
+    def iter_users(self) -> Iterator[Dict[str, Any]]:
+        """
+        流式获取用户列表（需要认证），逐个产出用户而不整体载入内存
+        
+        不完整迭代时应调用返回值的 close() 或丢弃引用，以便释放连接
+        """
+        response = self._make_request('GET', '/api/users', stream=True, item_prefix='users.item')
         return response.data
     
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """创建新用户（需要认证）"""
-        response = self._make_request('POST', '/api/users', data=user_data)
+        response = self._post('/api/users', user_data)
         return response.data
     
     def get_admin_dashboard(self) -> Dict[str, Any]:
         """获取管理员仪表板（需要管理员权限）"""
-        response = self._make_request('GET', '/admin/dashboard')
+        response = self._get('/admin/dashboard')
         return response.data
     
     def cors_preflight_check(self, endpoint: str, method: str = 'GET') -> ApiResponse:
+        """
+        发送 CORS 预检请求
+        
+        与浏览器一致，按响应的 Access-Control-Max-Age 缓存预检结果
+        """
+        request_headers = 'Content-Type, Authorization'
+        key = (endpoint, method, frozenset(h.strip().lower() for h in request_headers.split(',')))
+        cached = self._preflight_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        
+        headers = {
+            'Access-Control-Request-Method': method,
+            'Access-Control-Request-Headers': request_headers
+        }
+        response = self._make_request('OPTIONS', endpoint, headers=headers)
+        
+        try:
+            max_age = int(response.headers.get('Access-Control-Max-Age', 0))
+        except ValueError:
+            max_age = 0
+        if max_age > 0:
+            self._preflight_cache[key] = (now + max_age, response)
+        
+        return response
+    
+    def invalidate_preflight_cache(self) -> None:
+        """清空 CORS 预检缓存"""
+        self._preflight_cache.clear()
+
+
+class AsyncHushApiClient:
+    """
+    Hush API 异步客户端类
+    基于 httpx.AsyncClient，在单个事件循环中复用连接并发执行请求
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        timeout: int = 30,
+        warmup: bool = False
+    ):
+        """
+        初始化异步 API 客户端
+        
+        Args:
+            base_url: API 基础 URL
+            timeout: 请求超时时间（秒）
+            warmup: 是否在进入 async with 时预热连接
+        """
+        if httpx is None:
+            raise ImportError("请安装 httpx 库: pip install httpx[http2]")
+        
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.token = None
+        self._warmup = warmup
+        
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'HushApiClient/1.0.0 (Python)'
+            },
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+        )
+    
+    async def __aenter__(self) -> 'AsyncHushApiClient':
+        if self._warmup:
+            await self.warmup()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """关闭底层连接池"""
+        await self._client.aclose()
+    
+    async def warmup(self) -> None:
+        """发送 HEAD /health 预热 DNS 缓存和连接池，失败时静默忽略"""
+        try:
+            await self._client.head('/health', timeout=2)
+        except httpx.HTTPError:
+            pass
+    
+    def set_auth_token(self, token: str) -> None:
+        """设置认证令牌"""
+        self.token = token
+        self._client.headers['Authorization'] = f'Bearer {token}'
+        logger.info("🔐 已设置认证令牌")
+    
+    async def _make_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        data: Any = None, 
+        headers: Dict[str, str] = None,
+        params: Dict[str, str] = None
+    ) -> ApiResponse:
+        """
+        发送异步 HTTP 请求
+        
+        Args:
+            method: HTTP 方法
+            endpoint: API 端点
+            data: 请求数据
+            headers: 额外的请求头
+            params: URL 参数
+            
+        Returns:
+            ApiResponse: 响应对象
+            
+        Raises:
+            HushApiError: API 请求异常
+        """
+        logger.info("🚀 发送请求: %s %s%s", method, self.base_url, endpoint)
+        
+        try:
+            response = await self._client.request(
+                method,
+                endpoint,
+                content=_json_dumps(data) if data and method in {'POST', 'PUT', 'PATCH'} else None,
+                headers=headers,
+                params=params
+            )
+            
+            logger.debug("🔗 协议版本: %s", response.http_version)
+            
+            # 解析响应数据
+            response_data = _parse_response_data(response)
+            
+            return _check_response(
+                response, response_data, response.is_success, response.reason_phrase
+            )
+                
+        except httpx.HTTPError as e:
+            logger.error("❌ 网络错误: %s", e)
+            raise HushApiError(f"网络错误: {str(e)}")
+    
+    # ========================================================================
+    # API 方法
+    # ========================================================================
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """健康检查"""
+        response = await self._make_request('GET', '/health')
+        return response.data
+    
+    async def get_user_info(self) -> str:
+        """获取用户信息"""
+        response = await self._make_request('GET', '/user')
+        return response.data
+    
+    async def get_users(self) -> Dict[str, Any]:
+        """获取用户列表（需要认证）"""
+        response = await self._make_request('GET', '/api/users')
+        return response.data
+    
+    async def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """创建新用户（需要认证）"""
+        response = await self._make_request('POST', '/api/users', data=user_data)
+        return response.data
+    
+    async def get_admin_dashboard(self) -> Dict[str, Any]:
+        """获取管理员仪表板（需要管理员权限）"""
+        response = await self._make_request('GET', '/admin/dashboard')
+        return response.data
+    
+    async def cors_preflight_check(self, endpoint: str, method: str = 'GET') -> ApiResponse:
         """发送 CORS 预检请求"""
         headers = {
             'Access-Control-Request-Method': method,
             'Access-Control-Request-Headers': 'Content-Type, Authorization'
         }
-        return self._make_request('OPTIONS', endpoint, headers=headers)
+        return await self._make_request('OPTIONS', endpoint, headers=headers)
 
 
 # ============================================================================
 # 使用示例
 # ============================================================================
 
-def basic_usage_example():
+def _restore_auth_token(client: HushApiClient, token: Optional[str]) -> None:
+    """恢复示例运行前客户端的认证令牌"""
+    if token is None:
+        client.clear_auth_token()
+    else:
+        client.set_auth_token(token)
+
+
+def basic_usage_example(client: Optional[HushApiClient] = None):
     """基本使用示例"""
     print("\n🎯 基本使用示例")
     print("=" * 50)
     
-    client = HushApiClient()
+    if client is None:
+        client = HushApiClient()
     
     try:
         # 1. 健康检查
@@ -247,12 +824,17 @@ def basic_usage_example():
             print(f"错误详情: {e.response_data}")
 
 
-def authentication_example():
+def authentication_example(client: Optional[HushApiClient] = None):
     """认证示例"""
     print("\n🔐 认证示例")
     print("=" * 50)
     
-    client = HushApiClient()
+    if client is None:
+        client = HushApiClient()
+    
+    # 示例会修改令牌，结束后恢复调用方客户端原有的认证状态
+    previous_token = client.token
+    client.clear_auth_token()
     
     try:
         # 1. 尝试无认证访问受保护端点
@@ -277,14 +859,17 @@ def authentication_example():
             
     except Exception as e:
         print(f"❌ 认证示例失败: {e}")
+    finally:
+        _restore_auth_token(client, previous_token)
 
 
-def cors_example():
+def cors_example(client: Optional[HushApiClient] = None):
     """CORS 示例"""
     print("\n🌐 CORS 示例")
     print("=" * 50)
     
-    client = HushApiClient()
+    if client is None:
+        client = HushApiClient()
     
     try:
         # 1. CORS 预检请求
@@ -320,12 +905,15 @@ def cors_example():
         print(f"❌ CORS 示例失败: {e}")
 
 
-def post_request_example():
+def post_request_example(client: Optional[HushApiClient] = None):
     """POST 请求示例"""
     print("\n📝 POST 请求示例")
     print("=" * 50)
     
-    client = HushApiClient()
+    if client is None:
+        client = HushApiClient()
+    
+    previous_token = client.token
     client.set_auth_token("valid_jwt_token_here")
     
     try:
@@ -344,26 +932,31 @@ def post_request_example():
             
     except Exception as e:
         print(f"❌ POST 请求示例失败: {e}")
+    finally:
+        _restore_auth_token(client, previous_token)
+
+
+# 常见状态码对应的错误提示
+_ERROR_MESSAGES = {
+    401: "🔒 认证错误: 请提供有效的认证令牌",
+    403: "🚫 权限错误: 访问被拒绝",
+    429: "🚦 限流错误: 请求过于频繁，请稍后重试",
+    500: "💥 服务器错误: 内部服务器错误"
+}
 
 
-def error_handling_example():
+def error_handling_example(client: Optional[HushApiClient] = None):
     """错误处理示例"""
     print("\n⚠️ 错误处理示例")
     print("=" * 50)
     
-    client = HushApiClient()
+    if client is None:
+        client = HushApiClient()
     
     def handle_api_error(error: HushApiError):
         """处理 API 错误"""
-        error_messages = {
-            401: "🔒 认证错误: 请提供有效的认证令牌",
-            403: "🚫 权限错误: 访问被拒绝",
-            429: "🚦 限流错误: 请求过于频繁，请稍后重试",
-            500: "💥 服务器错误: 内部服务器错误"
-        }
-        
-        message = error_messages.get(error.status_code, f"❓ 未知错误: {error.status_code}")
-        print(message)
+        message = _ERROR_MESSAGES.get(error.status_code)
+        print(message if message else f"❓ 未知错误: {error.status_code}")
         
         if error.response_data:
             print(f"错误详情: {error.response_data}")
@@ -387,57 +980,91 @@ def error_handling_example():
         print(f"❌ 错误处理示例失败: {e}")
 
 
-def batch_request_example():
+async def _batch_request_async(sync_client: HushApiClient):
+    """使用 asyncio.gather 在单个事件循环中并发执行请求，沿用同步客户端的配置"""
+    async with AsyncHushApiClient(
+        base_url=sync_client.base_url,
+        timeout=sync_client.timeout
+    ) as client:
+        if sync_client.token:
+            client.set_auth_token(sync_client.token)
+        
+        names = ["健康检查", "用户信息", "用户列表"]
+        results = await asyncio.gather(
+            client.health_check(),
+            client.get_user_info(),
+            client.get_users(),  # 这个会失败
+            return_exceptions=True
+        )
+        
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                print(f"{name}: 错误: {str(result)}")
+            else:
+                print(f"{name}: {result}")
+
+
+def _batch_request_threaded(client: HushApiClient):
+    """未安装 httpx 时的线程池回退实现"""
+    
+    def safe_request(func, name):
+        """安全的请求包装器"""
+        try:
+            return name, func()
+        except Exception as e:
+            return name, f"错误: {str(e)}"
+    
+    # 定义要执行的请求
+    requests_to_make = [
+        (client.health_check, "健康检查"),
+        (client.get_user_info, "用户信息"),
+        (client.get_users, "用户列表")  # 这个会失败
+    ]
+    
+    # 使用共享线程池并行执行
+    futures = [
+        _SHARED_EXECUTOR.submit(safe_request, func, name) 
+        for func, name in requests_to_make
+    ]
+    
+    for future in concurrent.futures.as_completed(futures):
+        name, result = future.result()
+        print(f"{name}: {result}")
+
+
+def batch_request_example(client: Optional[HushApiClient] = None):
     """批量请求示例"""
     print("\n📦 批量请求示例")
     print("=" * 50)
     
-    client = HushApiClient()
-    
     try:
         print("\n1️⃣ 并行执行多个请求:")
         
-        import concurrent.futures
-        import threading
+        if client is None:
+            client = HushApiClient()
         
-        def safe_request(func, name):
-            """安全的请求包装器"""
-            try:
-                return name, func()
-            except Exception as e:
-                return name, f"错误: {str(e)}"
-        
-        # 定义要执行的请求
-        requests_to_make = [
-            (client.health_check, "健康检查"),
-            (client.get_user_info, "用户信息"),
-            (client.get_users, "用户列表")  # 这个会失败
-        ]
-        
-        # 使用线程池并行执行
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [
-                executor.submit(safe_request, func, name) 
-                for func, name in requests_to_make
-            ]
-            
-            for future in concurrent.futures.as_completed(futures):
-                name, result = future.result()
-                print(f"{name}: {result}")
+        if httpx is not None:
+            asyncio.run(_batch_request_async(client))
+        else:
+            _batch_request_threaded(client)
                 
     except Exception as e:
         print(f"❌ 批量请求示例失败: {e}")
 
 
-def retry_example():
+def retry_example(client: Optional[HushApiClient] = None):
     """重试机制示例"""
     print("\n🔄 重试机制示例")
     print("=" * 50)
     
-    client = HushApiClient()
+    if client is None:
+        client = HushApiClient()
     
     def retry_request(func, max_retries=3, delay=1.0):
         """重试请求函数"""
+        # 一次性计算所有等待时间，循环内只做索引
+        wait_times = _backoff_schedule(float(delay), max_retries)
+        
         for attempt in range(1, max_retries + 1):
             try:
                 print(f"尝试 {attempt}/{max_retries}...")
@@ -449,7 +1076,7 @@ def retry_example():
                     raise e
                 
                 # 指数退避
-                wait_time = delay * (2 ** (attempt - 1))
+                wait_time = wait_times[attempt - 1]
                 print(f"等待 {wait_time:.1f}s 后重试...")
                 time.sleep(wait_time)
     
@@ -457,11 +1084,13 @@ def retry_example():
         print("\n1️⃣ 重试失败的请求:")
         
         try:
-            result = retry_request(
-                lambda: client.get_users(),  # 这个请求会失败
-                max_retries=3,
-                delay=0.5
-            )
+            # 性能监控只包裹最外层的整体耗时，单次请求耗时见 ApiResponse.elapsed_ms
+            with client._performance_monitor("重试请求"):
+                result = retry_request(
+                    lambda: client.get_users(),  # 这个请求会失败
+                    max_retries=3,
+                    delay=0.5
+                )
             print(f"重试成功: {result}")
         except HushApiError as e:
             print(f"所有重试都失败了: {e}")
@@ -470,22 +1099,31 @@ def retry_example():
         print(f"❌ 重试示例失败: {e}")
 
 
-def performance_example():
+def performance_example(client: Optional[HushApiClient] = None):
     """性能监控示例"""
     print("\n📊 性能监控示例")
     print("=" * 50)
     
-    client = HushApiClient()
+    # 禁用响应缓存，否则测到的是缓存命中而不是真实请求
+    if client is None:
+        client = HushApiClient(cache_ttl=0)
+    else:
+        client = HushApiClient(
+            base_url=client.base_url,
+            timeout=client.timeout,
+            session=client.session,
+            cache_ttl=0
+        )
     
     try:
         print("\n1️⃣ 单个请求性能:")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         client.health_check()
-        elapsed = (time.time() - start_time) * 1000
-        print(f"单个请求耗时: {elapsed:.2f}ms")
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        print(f"单个请求耗时: {elapsed_ms:.2f}ms")
         
         print("\n2️⃣ 多个请求性能:")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         for i in range(5):
             try:
@@ -493,24 +1131,25 @@ def performance_example():
             except Exception as e:
                 print(f"请求 {i+1} 失败: {e}")
         
-        total_elapsed = (time.time() - start_time) * 1000
-        print(f"5个请求总耗时: {total_elapsed:.2f}ms")
-        print(f"平均每个请求: {total_elapsed/5:.2f}ms")
+        total_elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        print(f"5个请求总耗时: {total_elapsed_ms:.2f}ms")
+        print(f"平均每个请求: {total_elapsed_ms/5:.2f}ms")
         
     except Exception as e:
         print(f"❌ 性能监控示例失败: {e}")
 
 
-def advanced_usage_example():
+def advanced_usage_example(client: Optional[HushApiClient] = None):
     """高级使用示例"""
     print("\n🚀 高级使用示例")
     print("=" * 50)
     
     # 自定义配置的客户端
-    client = HushApiClient(
-        base_url="http://localhost:8080",
-        timeout=10
-    )
+    if client is None:
+        client = HushApiClient(
+            base_url="http://localhost:8080",
+            timeout=10
+        )
     
     try:
         print("\n1️⃣ 自定义请求头:")
@@ -543,6 +1182,9 @@ def run_all_examples():
     print("🚀 Hush 框架客户端 Python 示例")
     print("=" * 60)
     
+    # 所有示例共享同一个客户端及其连接池
+    client = HushApiClient()
+    
     examples = [
         basic_usage_example,
         authentication_example,
@@ -557,12 +1199,9 @@ def run_all_examples():
     
     for example in examples:
         try:
-            example()
+            example(client)
         except Exception as e:
-            logger.error(f"示例 {example.__name__} 执行失败: {e}")
-        
-        # 在示例之间稍作停顿
-        time.sleep(0.5)
+            logger.error("示例 %s 执行失败: %s", example.__name__, e)
     
     print("\n🎉 所有示例执行完成！")
 
@@ -574,6 +1213,18 @@ def interactive_mode():
     
     client = HushApiClient()
     
+    def set_token(c: HushApiClient, token: str) -> None:
+        c.set_auth_token(token)
+        print("认证令牌已设置")
+    
+    # 命令表只构建一次: 命令名 -> (所需参数个数, 处理函数)
+    commands = {
+        'health': (0, lambda c: print(f"结果: {c.health_check()}")),
+        'user': (0, lambda c: print(f"结果: {c.get_user_info()}")),
+        'users': (0, lambda c: print(f"结果: {c.get_users()}")),
+        'token': (1, set_token),
+    }
+    
     while True:
         print("\n可用命令:")
         print("1. health - 健康检查")
@@ -592,20 +1243,14 @@ def interactive_mode():
             
             if cmd == 'quit':
                 break
-            elif cmd == 'health':
-                result = client.health_check()
-                print(f"结果: {result}")
-            elif cmd == 'user':
-                result = client.get_user_info()
-                print(f"结果: {result}")
-            elif cmd == 'users':
-                result = client.get_users()
-                print(f"结果: {result}")
-            elif cmd == 'token' and len(command) > 1:
-                client.set_auth_token(command[1])
-                print("认证令牌已设置")
-            else:
+            
+            entry = commands.get(cmd)
+            if entry is None or len(command) <= entry[0]:
                 print("未知命令")
+                continue
+            
+            argc, handler = entry
+            handler(client, *command[1:argc + 1])
                 
         except HushApiError as e:
             print(f"❌ API 错误: {e.status_code} - {e.response_data}")
@@ -646,14 +1291,34 @@ if __name__ == "__main__":
    client.set_auth_token('your-jwt-token')
    users = client.get_users()
 
-4. 错误处理:
+4. 共享连接池:
+   # 所有客户端默认复用进程级会话，也可以传入自定义会话
+   client = HushApiClient(session=requests.Session())
+
+5. 连接预热:
+   # 构造时发送 HEAD /health，首个真实请求无需再做 DNS 解析和握手
+   client = HushApiClient(warmup=True)
+
+6. 响应缓存:
+   # health_check / get_user_info 的结果默认缓存 5 秒，cache_ttl=0 禁用
+   client = HushApiClient(cache_ttl=0)
+
+7. 异步客户端（需要 httpx）:
+   async with AsyncHushApiClient('http://your-server:port') as client:
+       health, users = await asyncio.gather(
+           client.health_check(),
+           client.get_users(),
+           return_exceptions=True
+       )
+
+8. 错误处理:
    try:
        result = client.some_method()
    except HushApiError as e:
        print(f'Status: {e.status_code}')
        print(f'Data: {e.response_data}')
 
-5. 自定义配置:
+9. 自定义配置:
    client = HushApiClient(
        base_url='http://localhost:8080',
        timeout=30
@@ -661,4 +1326,8 @@ if __name__ == "__main__":
 
 依赖安装:
    pip install requests
+   pip install httpx[http2]   # 可选
+   pip install orjson         # 可选
+   pip install numba          # 可选
+   pip install ijson          # 可选
 """
\ No newline at end of file